@@ -0,0 +1,223 @@
+"""
+test_dashboard.py — Dashboard helper tests (no display needed)
+Tests: settings.yaml cache, atomic settings writes, no-op settings saves,
+Excel read cache, agent stdout line sink, Treeview cell truncation.
+"""
+
+import sys
+import os
+import io
+import time
+import shutil
+import tempfile
+import contextlib
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Fix Windows console encoding
+if sys.platform == "win32":
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+passed = 0
+failed = 0
+
+
+def test(name, condition, detail=""):
+    global passed, failed
+    if condition:
+        passed += 1
+        print(f"  ✓ {name}")
+    else:
+        failed += 1
+        print(f"  ✗ {name}: {detail}")
+
+
+print("\n" + "=" * 55)
+print("  Dashboard Helper Tests")
+print("=" * 55)
+
+# ─── TEST 1: Module Import ───────────────────────────
+
+print("\n[Test 1] Dashboard Module Import")
+try:
+    from ui import dashboard
+    test("ui.dashboard imports", True)
+except Exception as e:
+    test("ui.dashboard imports", False, str(e))
+    print("\n  Cannot continue without ui.dashboard")
+    sys.exit(1)
+
+# All settings tests run against a scratch settings.yaml, never the real one
+tmp_dir = tempfile.mkdtemp(prefix="dash-test-")
+real_settings_path = dashboard.SETTINGS_PATH
+dashboard.SETTINGS_PATH = os.path.join(tmp_dir, "settings.yaml")
+dashboard._SETTINGS_CACHE = None
+
+try:
+    # ─── TEST 2: Settings Cache ──────────────────────
+
+    print("\n[Test 2] load_settings mtime/size Cache")
+    try:
+        with open(dashboard.SETTINGS_PATH, "w", encoding="utf-8") as f:
+            f.write("intelligence_mode: local\nscheduler:\n  mode: local\n")
+        first = dashboard.load_settings()
+        cache_entry = dashboard._SETTINGS_CACHE
+        second = dashboard.load_settings()
+        test("Parses settings.yaml", first.get("intelligence_mode") == "local", str(first))
+        test("Unchanged file is not re-parsed", dashboard._SETTINGS_CACHE is cache_entry)
+        test("Returns equal data from cache", first == second)
+
+        second["scheduler"]["mode"] = "changed"
+        test("Callers get a copy", dashboard.load_settings()["scheduler"]["mode"] == "local")
+
+        with open(dashboard.SETTINGS_PATH, "w", encoding="utf-8") as f:
+            f.write("intelligence_mode: hybrid\n")
+        test("Re-parses after the file changes",
+             dashboard.load_settings().get("intelligence_mode") == "hybrid")
+
+        os.remove(dashboard.SETTINGS_PATH)
+        test("Missing file falls back to local mode",
+             dashboard.load_settings() == {"intelligence_mode": "local"})
+    except Exception as e:
+        test("load_settings cache", False, str(e))
+
+    # ─── TEST 3: Atomic Settings Writes ──────────────
+
+    print("\n[Test 3] write_settings_text")
+    try:
+        text = "intelligence_mode: local\n"
+        test("First write reports a change", dashboard.write_settings_text(text) is True)
+        test("Identical write is skipped", dashboard.write_settings_text(text) is False)
+        with open(dashboard.SETTINGS_PATH, "r", encoding="utf-8") as f:
+            test("File holds the written text", f.read() == text)
+        test("No temp file left behind",
+             not os.path.exists(dashboard.SETTINGS_PATH + ".tmp"))
+    except Exception as e:
+        test("write_settings_text", False, str(e))
+
+    # ─── TEST 4: No-op Settings Saves ────────────────
+
+    print("\n[Test 4] save_settings + save_setting")
+    try:
+        data = {"intelligence_mode": "web_copilot", "scheduler": {"mode": "web_copilot"}}
+        dashboard.save_settings(data)
+        test("save_settings round-trips", dashboard.load_settings() == data)
+
+        # Backdate the file: a no-op save must leave the mtime alone
+        old = time.time() - 3600
+        os.utime(dashboard.SETTINGS_PATH, (old, old))
+        dashboard._SETTINGS_CACHE = None
+        dashboard.load_settings()
+        before = os.stat(dashboard.SETTINGS_PATH).st_mtime_ns
+        dashboard.save_settings(dict(data))
+        test("Saving identical data does not rewrite",
+             os.stat(dashboard.SETTINGS_PATH).st_mtime_ns == before)
+
+        dashboard.save_setting("intelligence_mode", "hybrid")
+        test("save_setting updates one key",
+             dashboard.load_settings() == {"intelligence_mode": "hybrid",
+                                           "scheduler": {"mode": "web_copilot"}})
+    except Exception as e:
+        test("save_settings", False, str(e))
+
+finally:
+    dashboard.SETTINGS_PATH = real_settings_path
+    dashboard._SETTINGS_CACHE = None
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+
+# ─── TEST 5: Excel Read Cache ────────────────────────
+
+print("\n[Test 5] _ExcelCache")
+book_dir = tempfile.mkdtemp(prefix="dash-test-")
+try:
+    workbook = os.path.join(book_dir, "book.xlsx")
+    with open(workbook, "w") as f:
+        f.write("v1")
+    calls = []
+
+    def reader():
+        calls.append(1)
+        return [{"n": len(calls)}]
+
+    cache = dashboard._ExcelCache({reader: workbook})
+    first = cache.get(reader)
+    test("First get reads the workbook", len(calls) == 1)
+    test("Second get is served from cache",
+         cache.get(reader) is first and len(calls) == 1)
+
+    newer = time.time() + 10
+    os.utime(workbook, (newer, newer))
+    cache.get(reader)
+    test("Changed mtime forces a re-read", len(calls) == 2)
+
+    cache.get(reader)
+    cache.clear()
+    cache.get(reader)
+    test("clear() drops cached results", len(calls) == 3, f"calls={len(calls)}")
+
+    # ttl applies to the entry being stored: ttl=0 expires it immediately
+    cache.clear()
+    cache.get(reader, ttl=0)
+    cache.get(reader)
+    test("Expired ttl forces a re-read", len(calls) == 5, f"calls={len(calls)}")
+
+    os.remove(workbook)
+    cache.get(reader)
+    test("Missing workbook still calls the reader", len(calls) == 6, f"calls={len(calls)}")
+except Exception as e:
+    test("_ExcelCache", False, str(e))
+finally:
+    shutil.rmtree(book_dir, ignore_errors=True)
+
+# ─── TEST 6: Agent Output Line Sink ──────────────────
+
+print("\n[Test 6] _LineSink")
+try:
+    out = []
+    sink = dashboard._LineSink(out.append)
+    sink.write("partial")
+    test("Partial line is held back", out == [])
+    sink.write(" line\nnext")
+    test("Completed line is emitted", out == ["partial line\n"], str(out))
+    sink.flush()
+    test("flush() emits the trailing partial line", out[-1] == "next", str(out))
+    sink.flush()
+    test("Empty flush emits nothing", len(out) == 2)
+
+    with contextlib.redirect_stdout(sink):
+        print("a\nb")
+        tty = sys.stdout.isatty()
+        encoding = sys.stdout.encoding
+    test("Works under redirect_stdout", "".join(out[2:]) == "a\nb\n", str(out))
+    test("Is a TextIOBase stream", isinstance(sink, io.TextIOBase))
+    test("isatty() is False", tty is False)
+    test("Has an encoding", encoding == "utf-8")
+    test("Is writable", sink.writable())
+except Exception as e:
+    test("_LineSink", False, str(e))
+
+# ─── TEST 7: Cell Truncation ─────────────────────────
+
+print("\n[Test 7] _trunc")
+try:
+    test("None becomes empty", dashboard._trunc(None, 10) == "")
+    test("Blank becomes empty", dashboard._trunc("", 10) == "")
+    test("Short text unchanged", dashboard._trunc("abc", 10) == "abc")
+    test("Long text cut to n", dashboard._trunc("x" * 50, 40) == "x" * 40)
+    test("Numbers are stringified", dashboard._trunc(12345, 3) == "123")
+except Exception as e:
+    test("_trunc", False, str(e))
+
+# ─── SUMMARY ─────────────────────────────────────────
+
+print("\n" + "=" * 55)
+total = passed + failed
+print(f"  Dashboard: {passed}/{total} tests passed")
+if failed == 0:
+    print("  ✓ ALL TESTS PASSED")
+else:
+    print(f"  ✗ {failed} tests failed")
+print("=" * 55)
+
+sys.exit(0 if failed == 0 else 1)
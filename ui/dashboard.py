@@ -6,35 +6,110 @@ Features: Intelligence Mode selector, RAM monitor, stats grid
 
 import os
 import sys
+import io
+import copy
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, scrolledtext
+import tkinter.font as tkfont
 import threading
 import json
+import concurrent.futures
+import heapq
+from collections import deque
+import sqlite3
+import time
+from pathlib import Path
 from datetime import datetime
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
 import psutil
+import requests
+from requests.adapters import HTTPAdapter
 import yaml
 
+# libyaml C bindings when available, pure-Python fallback otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# orjson renders large agent results several times faster when installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+from memory import excel_logger as _excel
+
+# One keep-alive HTTP session for the localhost Ollama/bridge calls
+_HTTP = requests.Session()
+_HTTP.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+_HTTP_TIMEOUT = (0.5, 2)  # (connect, read) — a dead local service fails fast
+
 
 # ─── Settings Helper ──────────────────────────────
 
 SETTINGS_PATH = os.path.join(PROJECT_ROOT, "config", "settings.yaml")
+PROFILE_PATH = os.path.join(PROJECT_ROOT, "config", "profile.yaml")
+DB_PATH = os.path.join(PROJECT_ROOT, "memory", "agent_memory.db")
+DB_URI_RO = Path(DB_PATH).as_uri() + "?mode=ro"
+GIGS_XLSX = os.path.join(PROJECT_ROOT, "memory", "gigs_created.xlsx")
+POST_DRAFTS_DIR = os.path.join(PROJECT_ROOT, "memory", "post_drafts")
+
+# (mtime_ns, size, parsed) of the last settings.yaml read or written
+_SETTINGS_CACHE = None
 
 
 def load_settings() -> dict:
+    """Parsed settings.yaml; re-parsed only when its mtime/size change. Returns a copy."""
+    global _SETTINGS_CACHE
     try:
+        st = os.stat(SETTINGS_PATH)
+        if _SETTINGS_CACHE and _SETTINGS_CACHE[:2] == (st.st_mtime_ns, st.st_size):
+            return copy.deepcopy(_SETTINGS_CACHE[2])
         with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        _SETTINGS_CACHE = (st.st_mtime_ns, st.st_size, data)
+        return copy.deepcopy(data)
     except Exception:
         return {"intelligence_mode": "local"}
 
 
+def write_settings_text(text: str) -> bool:
+    """Atomically replace settings.yaml with text. Returns False if it was already identical."""
+    try:
+        with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except OSError:
+        pass
+    tmp_path = SETTINGS_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, SETTINGS_PATH)
+    return True
+
+
 def save_settings(data: dict):
-    with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+    global _SETTINGS_CACHE
+    # Nothing to do if the file is unchanged on disk and already holds this data
+    try:
+        st = os.stat(SETTINGS_PATH)
+        if (_SETTINGS_CACHE and _SETTINGS_CACHE[:2] == (st.st_mtime_ns, st.st_size)
+                and _SETTINGS_CACHE[2] == data):
+            return
+    except OSError:
+        pass
+    write_settings_text(yaml.dump(data, Dumper=_YamlDumper,
+                                  default_flow_style=False, sort_keys=False))
+    st = os.stat(SETTINGS_PATH)
+    _SETTINGS_CACHE = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
 
 
 def save_setting(key: str, value):
@@ -56,6 +131,91 @@ YELLOW = "#f59e0b"
 RED = "#ef4444"
 PURPLE = "#8b5cf6"
 
+_GIB = 1 << 30
+
+TICK_MS = 1000  # Period of the shared scheduler timer
+UNFOCUSED_SCALE = 10  # Periodic intervals stretch by this factor while unfocused
+OUTPUT_MAX_LINES = 5000  # Command output keeps at most this many lines...
+OUTPUT_TRIM_LINES = 500  # ...dropping this many of the oldest at a time
+_SEPARATOR = "─" * 60 + "\n"  # Rule printed after the banner and each command
+
+STAT_NAMES = ("Jobs Applied", "Posts Made", "Gigs Active", "GitHub Activity")
+
+# GitHub activity + pending approval counts, one round-trip per overview refresh
+OVERVIEW_COUNTS_SQL = """
+    WITH
+      gh AS (SELECT COUNT(*) AS c FROM github_state),
+      pend AS (SELECT COUNT(*) AS c FROM pending_tasks WHERE status = 'pending')
+    SELECT gh.c, pend.c FROM gh, pend
+"""
+
+# RAM usage buckets → progressbar/label color
+RAM_COLORS = {"Green": GREEN, "Yellow": YELLOW, "Red": RED}
+
+
+def _trunc(value, n: int) -> str:
+    """First n characters of a cell value; empty string for None/blank cells."""
+    return str(value)[:n] if value else ""
+
+
+# ─── Excel Read Cache ────────────────────────────
+
+class _ExcelCache:
+    """Shares excel_logger reads between callers until the workbook changes or ttl expires."""
+
+    def __init__(self, paths: dict):
+        self._paths = paths  # {reader fn: workbook path}
+        self._entries = {}   # {reader fn: (mtime_ns, expires_at, result)}
+
+    def get(self, fn, ttl=10):
+        try:
+            mtime = os.stat(self._paths[fn]).st_mtime_ns
+        except OSError:
+            mtime = None
+        now = time.monotonic()
+        entry = self._entries.get(fn)
+        if entry and entry[0] == mtime and now < entry[1]:
+            return entry[2]
+        result = fn()
+        self._entries[fn] = (mtime, now + ttl, result)
+        return result
+
+    def clear(self):
+        self._entries.clear()
+
+
+# ─── Agent Output Sink ───────────────────────────
+
+class _LineSink(io.TextIOBase):
+    """Text stream for redirect_stdout that hands completed lines to emit(text) as written.
+
+    Subclasses TextIOBase so code probing sys.stdout (isatty, encoding,
+    writable, ...) sees a real, non-interactive text stream.
+    """
+
+    encoding = "utf-8"
+
+    def __init__(self, emit):
+        super().__init__()
+        self._emit = emit
+        self._buf = ""
+
+    def writable(self):
+        return True
+
+    def write(self, s):
+        self._buf += s
+        if "\n" in self._buf:
+            lines, _, self._buf = self._buf.rpartition("\n")
+            self._emit(lines + "\n")
+        return len(s)
+
+    def flush(self):
+        # Explicit flushes (print(..., flush=True)) also push partial lines
+        if self._buf:
+            self._emit(self._buf)
+            self._buf = ""
+
 
 # ─── Dashboard App ───────────────────────────────
 
@@ -68,7 +228,7 @@ class DashboardApp:
         self.root.minsize(800, 600)
 
         # Configure ttk style
-        self.style = ttk.Style()
+        self.style = ttk.Style(self.root)
         self.style.theme_use("clam")
         self._configure_styles()
 
@@ -80,66 +240,302 @@ class DashboardApp:
         header = tk.Frame(main, bg=ACCENT, height=48)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
-        tk.Label(header, text="⚡ BilalAgent v3.0", font=("Segoe UI", 14, "bold"),
+        tk.Label(header, text="⚡ BilalAgent v3.0", font=self._font_title,
                  bg=ACCENT, fg="white").pack(side=tk.LEFT, padx=16)
 
-        self.mode_label = tk.Label(header, text="Mode: Local", font=("Segoe UI", 10),
+        self.mode_label = tk.Label(header, text="Mode: Local", font=self._font_body,
                                    bg=ACCENT, fg="#bfdbfe")
         self.mode_label.pack(side=tk.RIGHT, padx=16)
 
+        self._excel_cache = _ExcelCache({
+            _excel.get_applications: _excel.EXCEL_PATH,
+            _excel.get_posts: _excel.POSTS_EXCEL_PATH,
+            _excel.get_gigs: _excel.GIGS_EXCEL_PATH,
+        })
+
+        # Shared worker pool for short reads (overview, Excel tabs, Ollama probe).
+        # Long toolbar actions run on daemon threads instead, see _spawn().
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=4,
+                                                           thread_name_prefix="dash-bg")
+        self._conn = None  # Read-only agent DB handle, see _db()
+        self._profile_cache = None  # (mtime_ns, size, parsed) of profile.yaml
+        # init_db + agent import run once in the background; commands wait on it
+        self._agent_future = self._start_daemon(self._load_agent)
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # Tab refreshes deferred until their tab is selected: {tab path: refresh}
+        self._stale_tabs = {}
+
+        # Command output queued by _append_output, drained by _flush_output
+        self._pending_output = deque()
+        self._flush_scheduled = False
+
         # Tabs
         self.notebook = ttk.Notebook(main, style="Dark.TNotebook")
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
 
         self._build_command_tab()
         self._build_overview_tab()
-        self._build_jobs_tab()
-        self._build_posts_tab()
-        self._build_gigs_tab()
-        self._build_settings_tab()
+
+        # Remaining tabs stay empty until first selected: {tab path: builder}
+        self._tab_builders = {}
+        self._jobs_tab = self._add_lazy_tab("  Jobs  ", self._build_jobs_tab)
+        self._posts_tab = self._add_lazy_tab("  Posts  ", self._build_posts_tab)
+        self._gigs_tab = self._add_lazy_tab("  Gigs  ", self._build_gigs_tab)
+        self._add_lazy_tab("  Settings  ", self._build_settings_tab)
 
         # Command history
-        self._cmd_history = []
+        self._cmd_history = deque(maxlen=500)  # Oldest commands fall off
         self._cmd_history_idx = -1
         self._agent_running = False
 
-        # Start RAM monitor
-        self._update_ram()
+        # Periodic jobs share one Tk timer:
+        # heap of (next_due, seq, interval_s, idle_interval_s, fn)
+        self._periodic = []
+        self._interval_scale = 1
+        self._paused = False
+        self._overview_active = self.notebook.select() == str(self._overview_tab)
+        self._every(3, self._update_ram, idle_interval=15)
+        self._every(15, self._probe_ollama)
+        self._every(30, self._refresh_overview, idle_interval=120)
+        # First RAM/overview refresh runs on the first tick, once the window is mapped
+        self._reschedule(run_tab_jobs=True)
+        self._probe_ollama()
+        self.root.bind("<Unmap>", self._on_root_unmap, add="+")
+        self.root.bind("<Map>", self._on_root_map, add="+")
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_change)
+        self.root.after(TICK_MS, self._tick)
+
+    # ─── Periodic Scheduler ──────────────────────
+
+    def _every(self, interval, fn, idle_interval=None):
+        """Register fn to run every `interval` seconds on the shared tick.
+
+        Jobs given an idle_interval belong to the Overview tab and fall back to
+        that slower cadence while another tab is selected.
+        """
+        due = time.monotonic() + self._job_interval(interval, idle_interval)
+        heapq.heappush(self._periodic,
+                       (due, len(self._periodic), interval, idle_interval, fn))
+
+    def _job_interval(self, interval, idle_interval):
+        if idle_interval is not None and not self._overview_active:
+            interval = idle_interval
+        return interval * self._interval_scale
+
+    def _tick(self):
+        """Run whichever periodic jobs are due, then re-arm the single timer."""
+        if self._window_visible():
+            self._set_interval_scale(1 if self._has_focus() else UNFOCUSED_SCALE)
+            self._run_due()
+        self.root.after(TICK_MS, self._tick)
+
+    def _run_due(self):
+        now = time.monotonic()
+        while self._periodic and self._periodic[0][0] <= now:
+            _, seq, interval, idle_interval, fn = heapq.heappop(self._periodic)
+            try:
+                fn()
+            except Exception:
+                pass
+            heapq.heappush(self._periodic,
+                           (now + self._job_interval(interval, idle_interval),
+                            seq, interval, idle_interval, fn))
+
+    def _reschedule(self, run_tab_jobs=False):
+        """Re-apply the current cadence, pulling jobs in if it got shorter.
+
+        run_tab_jobs makes every Overview-bound job due immediately.
+        """
+        now = time.monotonic()
+        periodic = []
+        for due, seq, interval, idle_interval, fn in self._periodic:
+            if run_tab_jobs and idle_interval is not None:
+                due = now
+            else:
+                due = min(due, now + self._job_interval(interval, idle_interval))
+            periodic.append((due, seq, interval, idle_interval, fn))
+        heapq.heapify(periodic)
+        self._periodic = periodic
+
+    def _set_interval_scale(self, scale):
+        """Stretch or restore periodic intervals, pulling stretched jobs back in on refocus."""
+        if scale == self._interval_scale:
+            return
+        self._interval_scale = scale
+        self._reschedule()
+
+    def _on_tab_change(self, event=None):
+        selected = self.notebook.select()
+        was_active = self._overview_active
+        self._overview_active = selected == str(self._overview_tab)
+        if self._overview_active and not was_active:
+            self._probe_ollama()
+            self._reschedule(run_tab_jobs=True)
+            self._run_due()
+
+        # First selection builds the tab, which loads fresh data itself
+        builder = self._tab_builders.pop(selected, None)
+        if builder:
+            builder()
+            self._stale_tabs.pop(selected, None)
+
+        # Tabs whose data changed while hidden refresh on their next selection
+        refresh = self._stale_tabs.pop(selected, None)
+        if refresh:
+            refresh()
+
+    def _add_lazy_tab(self, text, builder):
+        """Add an empty tab that builder(tab) fills in when it is first selected."""
+        tab = tk.Frame(self.notebook, bg=BG)
+        self.notebook.add(tab, text=text)
+        self._tab_builders[str(tab)] = lambda: builder(tab)
+        return tab
+
+    def _refresh_when_visible(self, tab, refresh):
+        """Run refresh now if tab is selected, otherwise when it is next selected."""
+        if self.notebook.select() == str(tab):
+            refresh()
+        else:
+            self._stale_tabs[str(tab)] = refresh
+
+    def _window_visible(self):
+        """False while the window is iconified, withdrawn or otherwise unmapped."""
+        return not self._paused and bool(self.root.winfo_viewable())
+
+    def _has_focus(self):
+        try:
+            return self.root.focus_get() is not None
+        except KeyError:  # focus on a Tk-internal widget (e.g. a popdown)
+            return True
+
+    # Root bindings also fire for every child widget; only the toplevel counts
+    def _on_root_unmap(self, event):
+        if event.widget is self.root:
+            self._paused = True
+
+    def _on_root_map(self, event):
+        if event.widget is self.root:
+            self._paused = False
+
+    def _on_close(self):
+        if self._mode_save_handle is not None:
+            # A mode picked within the debounce window must still reach settings.yaml
+            self.root.after_cancel(self._mode_save_handle)
+            self._commit_mode_change()
+        if self._conn is not None:
+            self._conn.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
+    # ─── Background Work ─────────────────────────
+
+    def _submit(self, fn, *args, on_done=None):
+        """Run fn(*args) on the worker pool; on_done(result) runs on the Tk thread."""
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_bg_done, f, on_done))
+        return future
+
+    def _spawn(self, fn, *args, on_done=None):
+        """Like _submit, but on a daemon thread so a long user action never delays exit.
+
+        Pool workers are joined at interpreter shutdown, and
+        shutdown(cancel_futures=True) only drops work that has not started yet.
+        """
+        future = self._start_daemon(fn, *args)
+        future.add_done_callback(lambda f: self.root.after(0, self._on_bg_done, f, on_done))
+        return future
+
+    @staticmethod
+    def _start_daemon(fn, *args) -> concurrent.futures.Future:
+        """Run fn(*args) on a new daemon thread; the caller consumes the Future."""
+        future = concurrent.futures.Future()
+
+        def run():
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True, name="dash-action").start()
+        return future
+
+    def _on_bg_done(self, future, on_done):
+        try:
+            result = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", str(e), parent=self.root)
+            return
+        if on_done:
+            on_done(result)
 
     def _configure_styles(self):
+        # Named fonts are created once and shared by every widget that uses them.
+        # Pinned to this window's interpreter, never whichever root is the default.
+        def font(**options):
+            return tkfont.Font(root=self.root, **options)
+
+        self._font_small = font(family="Segoe UI", size=9)
+        self._font_small_bold = font(family="Segoe UI", size=9, weight="bold")
+        self._font_body = font(family="Segoe UI", size=10)
+        self._font_bold = font(family="Segoe UI", size=10, weight="bold")
+        self._font_card = font(family="Segoe UI", size=11, weight="bold")
+        self._font_card_title = font(family="Segoe UI", size=12, weight="bold")
+        self._font_heading = font(family="Segoe UI", size=13, weight="bold")
+        self._font_title = font(family="Segoe UI", size=14, weight="bold")
+        self._font_stat = font(family="Segoe UI", size=22, weight="bold")
+        self._font_stat_large = font(family="Segoe UI", size=24, weight="bold")
+        self._font_mono_small = font(family="Consolas", size=9)
+        self._font_mono = font(family="Consolas", size=10)
+        self._font_mono_bold = font(family="Consolas", size=10, weight="bold")
+        self._font_editor = font(family="Consolas", size=11)
+        self._font_input = font(family="Consolas", size=12)
+        self._font_prompt = font(family="Consolas", size=16, weight="bold")
+
         s = self.style
         s.configure("Main.TFrame", background=BG)
         s.configure("Card.TFrame", background=BG_CARD)
         s.configure("Dark.TNotebook", background=BG, borderwidth=0)
         s.configure("Dark.TNotebook.Tab", background=BG_CARD, foreground=FG,
-                     padding=[16, 8], font=("Segoe UI", 10))
+                     padding=[16, 8], font=self._font_body)
         s.map("Dark.TNotebook.Tab",
               background=[("selected", ACCENT)],
               foreground=[("selected", "white")])
-        s.configure("Card.TLabel", background=BG_CARD, foreground=FG, font=("Segoe UI", 10))
+        s.configure("Card.TLabel", background=BG_CARD, foreground=FG, font=self._font_body)
         s.configure("CardTitle.TLabel", background=BG_CARD, foreground=FG,
-                     font=("Segoe UI", 12, "bold"))
+                     font=self._font_card_title)
         s.configure("Stat.TLabel", background=BG_CARD, foreground=ACCENT,
-                     font=("Segoe UI", 24, "bold"))
+                     font=self._font_stat_large)
         s.configure("StatSub.TLabel", background=BG_CARD, foreground=FG_DIM,
-                     font=("Segoe UI", 9))
+                     font=self._font_small)
         s.configure("Dark.Horizontal.TProgressbar", troughcolor=BG_INPUT,
                      background=GREEN, thickness=18)
+        # One style per RAM bucket — the bar swaps styles instead of reconfiguring one
+        for bucket, color in RAM_COLORS.items():
+            s.configure(f"{bucket}.Horizontal.TProgressbar", troughcolor=BG_INPUT,
+                         background=color, thickness=18)
+
+    def _card(self, parent, text, fg, padx=16, pady=10):
+        """Titled card frame used for every Overview section."""
+        return tk.LabelFrame(parent, text=text, bg=BG_CARD, fg=fg, font=self._font_card,
+                             padx=padx, pady=pady, bd=1, relief="groove",
+                             highlightbackground=BG_INPUT)
 
     # ─── Tab 1: Overview ─────────────────────────
 
     def _build_overview_tab(self):
         tab = tk.Frame(self.notebook, bg=BG)
         self.notebook.add(tab, text="  Overview  ")
+        self._overview_tab = tab
 
         # Mode selector card
-        mode_frame = tk.LabelFrame(tab, text="  Intelligence Mode  ", bg=BG_CARD, fg=ACCENT,
-                                    font=("Segoe UI", 11, "bold"), padx=16, pady=12,
-                                    bd=1, relief="groove", highlightbackground=BG_INPUT)
+        mode_frame = self._card(tab, "  Intelligence Mode  ", ACCENT, pady=12)
         mode_frame.pack(fill=tk.X, padx=12, pady=(12, 6))
 
         settings = load_settings()
-        self.mode_var = tk.StringVar(value=settings.get("intelligence_mode", "local"))
+        self.mode_var = tk.StringVar(master=self.root,
+                                     value=settings.get("intelligence_mode", "local"))
 
         modes = [
             ("🔒  Pure Local (Ollama only — private, offline, unlimited)", "local"),
@@ -151,213 +547,268 @@ class DashboardApp:
             rb = tk.Radiobutton(mode_frame, text=text, variable=self.mode_var, value=val,
                                 bg=BG_CARD, fg=FG, selectcolor=BG_INPUT,
                                 activebackground=BG_CARD, activeforeground=ACCENT,
-                                font=("Segoe UI", 10), anchor="w", indicatoron=True,
+                                font=self._font_body, anchor="w", indicatoron=True,
                                 highlightthickness=0)
             rb.pack(anchor="w", pady=2)
 
+        self._mode_save_handle = None
         self.mode_var.trace_add("write", self._on_mode_change)
 
         # RAM Monitor card
-        ram_frame = tk.LabelFrame(tab, text="  RAM Monitor  ", bg=BG_CARD, fg=GREEN,
-                                   font=("Segoe UI", 11, "bold"), padx=16, pady=10,
-                                   bd=1, relief="groove", highlightbackground=BG_INPUT)
+        ram_frame = self._card(tab, "  RAM Monitor  ", GREEN)
         ram_frame.pack(fill=tk.X, padx=12, pady=6)
 
         self.ram_bar = ttk.Progressbar(ram_frame, style="Dark.Horizontal.TProgressbar",
                                         length=400, mode="determinate")
         self.ram_bar.pack(fill=tk.X, pady=(0, 4))
+        self._ram_style = None
+        self._last_ram_text = None
+        self._ollama_model_name = "none"  # Written by the background probe
 
         self.ram_label = tk.Label(ram_frame, text="Loading...", bg=BG_CARD, fg=FG_DIM,
-                                   font=("Consolas", 10))
+                                   font=self._font_mono)
         self.ram_label.pack(anchor="w")
 
         # ─── UI-TARS Vision Agent (Phase 9) ──────
-        uitars_frame = tk.LabelFrame(tab, text="  UI-TARS Vision Agent  ", bg=BG_CARD, fg="#FF6B6B",
-                                      font=("Segoe UI", 11, "bold"), padx=16, pady=8,
-                                      bd=1, relief="groove", highlightbackground=BG_INPUT)
+        uitars_frame = self._card(tab, "  UI-TARS Vision Agent  ", "#FF6B6B", pady=8)
         uitars_frame.pack(fill=tk.X, padx=12, pady=6)
 
         uitars_row = tk.Frame(uitars_frame, bg=BG_CARD)
         uitars_row.pack(fill=tk.X)
 
         self.uitars_status = tk.Label(uitars_row, text="● Stopped", bg=BG_CARD, fg=RED,
-                                       font=("Segoe UI", 10, "bold"))
+                                       font=self._font_bold)
         self.uitars_status.pack(side=tk.LEFT, padx=(0, 16))
 
         tk.Button(uitars_row, text="Start 2B", bg="#4ECDC4", fg="black",
-                  font=("Segoe UI", 9, "bold"), bd=0, padx=10, pady=3,
+                  font=self._font_small_bold, bd=0, padx=10, pady=3,
                   command=lambda: self._uitars_action("start", "2b")).pack(side=tk.LEFT, padx=2)
         tk.Button(uitars_row, text="Start 7B", bg="#FF6B6B", fg="white",
-                  font=("Segoe UI", 9, "bold"), bd=0, padx=10, pady=3,
+                  font=self._font_small_bold, bd=0, padx=10, pady=3,
                   command=lambda: self._uitars_action("start", "7b")).pack(side=tk.LEFT, padx=2)
         tk.Button(uitars_row, text="Stop", bg=BG_INPUT, fg=FG,
-                  font=("Segoe UI", 9), bd=0, padx=10, pady=3,
+                  font=self._font_small, bd=0, padx=10, pady=3,
                   command=lambda: self._uitars_action("stop")).pack(side=tk.LEFT, padx=2)
 
         self.uitars_last_action = tk.Label(uitars_frame, text="Last action: —",
-                                            bg=BG_CARD, fg=FG_DIM, font=("Segoe UI", 9))
+                                            bg=BG_CARD, fg=FG_DIM, font=self._font_small)
         self.uitars_last_action.pack(anchor="w", pady=(4, 0))
 
         # ─── Permission Controls (Phase 9) ──────
-        perm_frame = tk.LabelFrame(tab, text="  Permission Controls  ", bg=BG_CARD, fg=YELLOW,
-                                    font=("Segoe UI", 11, "bold"), padx=16, pady=8,
-                                    bd=1, relief="groove", highlightbackground=BG_INPUT)
+        perm_frame = self._card(tab, "  Permission Controls  ", YELLOW, pady=8)
         perm_frame.pack(fill=tk.X, padx=12, pady=6)
 
         perm_row = tk.Frame(perm_frame, bg=BG_CARD)
         perm_row.pack(fill=tk.X)
 
         self.perm_status = tk.Label(perm_row, text="Manual — asking each action", bg=BG_CARD, fg=GREEN,
-                                     font=("Segoe UI", 10, "bold"))
+                                     font=self._font_bold)
         self.perm_status.pack(side=tk.LEFT, padx=(0, 16))
 
         tk.Button(perm_row, text="Allow All 30min", bg=YELLOW, fg="black",
-                  font=("Segoe UI", 9, "bold"), bd=0, padx=10, pady=3,
+                  font=self._font_small_bold, bd=0, padx=10, pady=3,
                   command=lambda: self._set_allow_all(30)).pack(side=tk.LEFT, padx=2)
         tk.Button(perm_row, text="Allow All 2hr", bg="#f59e0b", fg="black",
-                  font=("Segoe UI", 9), bd=0, padx=10, pady=3,
+                  font=self._font_small, bd=0, padx=10, pady=3,
                   command=lambda: self._set_allow_all(120)).pack(side=tk.LEFT, padx=2)
         tk.Button(perm_row, text="Revoke", bg=RED, fg="white",
-                  font=("Segoe UI", 9, "bold"), bd=0, padx=10, pady=3,
+                  font=self._font_small_bold, bd=0, padx=10, pady=3,
                   command=lambda: self._set_allow_all(0)).pack(side=tk.LEFT, padx=2)
 
         skip_row = tk.Frame(perm_frame, bg=BG_CARD)
         skip_row.pack(fill=tk.X, pady=(6, 0))
 
-        self.skip_scroll_var = tk.BooleanVar(value=False)
-        self.skip_extract_var = tk.BooleanVar(value=False)
+        self.skip_scroll_var = tk.BooleanVar(master=self.root, value=False)
+        self.skip_extract_var = tk.BooleanVar(master=self.root, value=False)
         tk.Checkbutton(skip_row, text="Skip scroll actions", variable=self.skip_scroll_var,
                         bg=BG_CARD, fg=FG, selectcolor=BG_INPUT,
-                        font=("Segoe UI", 9)).pack(side=tk.LEFT, padx=(0, 16))
+                        font=self._font_small).pack(side=tk.LEFT, padx=(0, 16))
         tk.Checkbutton(skip_row, text="Skip extract actions", variable=self.skip_extract_var,
                         bg=BG_CARD, fg=FG, selectcolor=BG_INPUT,
-                        font=("Segoe UI", 9)).pack(side=tk.LEFT)
+                        font=self._font_small).pack(side=tk.LEFT)
 
         # Stats + Actions row
         row = tk.Frame(tab, bg=BG)
         row.pack(fill=tk.X, padx=12, pady=6)
 
         # Stats grid
-        stats_frame = tk.LabelFrame(row, text="  Stats  ", bg=BG_CARD, fg=PURPLE,
-                                     font=("Segoe UI", 11, "bold"), padx=12, pady=8,
-                                     bd=1, relief="groove", highlightbackground=BG_INPUT)
+        stats_frame = self._card(row, "  Stats  ", PURPLE, padx=12, pady=8)
         stats_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 4))
 
         self.stat_labels = {}
-        stats = self._get_stats()
+        self._stat_last_text = dict.fromkeys(STAT_NAMES, "0")  # What each label shows now
         col = 0
-        for name, value in stats.items():
+        for name in STAT_NAMES:
             f = tk.Frame(stats_frame, bg=BG_CARD)
             f.grid(row=0, column=col, padx=12, pady=4)
-            v_lbl = tk.Label(f, text=str(value), bg=BG_CARD, fg=ACCENT,
-                             font=("Segoe UI", 22, "bold"))
+            v_lbl = tk.Label(f, text="0", bg=BG_CARD, fg=ACCENT,
+                             font=self._font_stat)
             v_lbl.pack()
             tk.Label(f, text=name, bg=BG_CARD, fg=FG_DIM,
-                     font=("Segoe UI", 9)).pack()
+                     font=self._font_small).pack()
             self.stat_labels[name] = v_lbl
             col += 1
 
         # Pending approvals
-        pending_frame = tk.LabelFrame(row, text="  Approvals  ", bg=BG_CARD, fg=YELLOW,
-                                       font=("Segoe UI", 11, "bold"), padx=12, pady=8,
-                                       bd=1, relief="groove", highlightbackground=BG_INPUT)
+        pending_frame = self._card(row, "  Approvals  ", YELLOW, padx=12, pady=8)
         pending_frame.pack(side=tk.RIGHT, fill=tk.Y, padx=(4, 0))
 
         self.pending_label = tk.Label(pending_frame, text="0", bg=BG_CARD, fg=YELLOW,
-                                       font=("Segoe UI", 22, "bold"))
+                                       font=self._font_stat)
         self.pending_label.pack()
+        self._pending_last_text = "0"
         tk.Label(pending_frame, text="Pending", bg=BG_CARD, fg=FG_DIM,
-                 font=("Segoe UI", 9)).pack()
+                 font=self._font_small).pack()
         tk.Button(pending_frame, text="Review Now", bg=ACCENT, fg="white",
-                  font=("Segoe UI", 9, "bold"), bd=0, padx=10, pady=4,
+                  font=self._font_small_bold, bd=0, padx=10, pady=4,
                   command=self._review_pending).pack(pady=(6, 0))
 
         # Recent Actions log
-        log_frame = tk.LabelFrame(tab, text="  Recent Actions  ", bg=BG_CARD, fg=FG,
-                                   font=("Segoe UI", 11, "bold"), padx=12, pady=8,
-                                   bd=1, relief="groove", highlightbackground=BG_INPUT)
+        log_frame = self._card(tab, "  Recent Actions  ", FG, padx=12, pady=8)
         log_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=(6, 12))
 
-        self.log_text = tk.Text(log_frame, bg=BG_INPUT, fg=FG, font=("Consolas", 9),
+        self.log_text = tk.Text(log_frame, bg=BG_INPUT, fg=FG, font=self._font_mono_small,
                                  height=8, bd=0, wrap=tk.WORD, state=tk.DISABLED,
                                  insertbackground=FG)
         self.log_text.pack(fill=tk.BOTH, expand=True)
 
-        self._refresh_overview()
+        # Newest-first tail of action_log; refreshes only fetch rows past the last id
+        self._recent_actions = deque(maxlen=15)
+        self._last_action_id = None
+        self._last_log_text = ""
+        self._overview_future = None
+        self._stats_cache = (0.0, {})  # (monotonic time, stats); reset after user actions
 
     def _on_mode_change(self, *args):
         mode = self.mode_var.get()
-        save_setting("intelligence_mode", mode)
         labels = {"local": "🔒 Local", "web_copilot": "🌐 Web Copilot", "hybrid": "✨ Hybrid"}
         self.mode_label.config(text=f"Mode: {labels.get(mode, mode)}")
 
-        # Update scheduler mode too
+        # Coalesce bursts of trace callbacks into one save 200ms after the last
+        if self._mode_save_handle is not None:
+            self.root.after_cancel(self._mode_save_handle)
+        self._mode_save_handle = self.root.after(200, self._commit_mode_change)
+
+    def _commit_mode_change(self):
+        self._mode_save_handle = None
+        mode = self.mode_var.get()
+
+        # Intelligence mode and scheduler mode go out in a single write
         settings = load_settings()
+        settings["intelligence_mode"] = mode
         if "scheduler" in settings:
             settings["scheduler"]["mode"] = mode
-            save_settings(settings)
+        save_settings(settings)
+
+    _STATS_TTL = 25  # Seconds a computed stats dict is reused by passive refreshes
 
     def _get_stats(self) -> dict:
-        stats = {"Jobs Applied": 0, "Posts Made": 0, "Gigs Active": 0, "GitHub Activity": 0}
+        """Excel-backed counts; GitHub Activity is filled in from SQLite by _refresh_overview."""
+        cached_at, cached = self._stats_cache
+        now = time.monotonic()
+        if cached and now - cached_at < self._STATS_TTL:
+            return dict(cached)
+        stats = dict.fromkeys(STAT_NAMES, 0)
         try:
-            from memory.excel_logger import get_applications, get_posts, get_gigs
-            stats["Jobs Applied"] = len(get_applications())
-            stats["Posts Made"] = len(get_posts())
-            stats["Gigs Active"] = len(get_gigs())
+            stats["Jobs Applied"] = len(self._excel_cache.get(_excel.get_applications))
+            stats["Posts Made"] = len(self._excel_cache.get(_excel.get_posts))
+            stats["Gigs Active"] = len(self._excel_cache.get(_excel.get_gigs))
         except Exception:
             pass
+        self._stats_cache = (now, stats)
+        return dict(stats)
+
+    def _db(self) -> sqlite3.Connection:
+        """Long-lived read-only connection to the agent DB, opened on first use.
+
+        Only the overview worker queries it, one refresh at a time.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(DB_URI_RO, uri=True, check_same_thread=False)
+            conn.execute("PRAGMA query_only = ON")
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA mmap_size = 67108864")  # Serve hot pages from a 64MB mapping
+            self._conn = conn
+        return self._conn
+
+    def _refresh_overview_db(self, last_action_id=None) -> dict:
+        """All overview SQLite reads on the shared read-only connection.
+
+        Returns the GitHub and pending counts plus action_log rows newer than
+        last_action_id (or the latest 15 when it is None), newest first.
+        """
+        conn = self._db()
         try:
-            import sqlite3
-            db = os.path.join(PROJECT_ROOT, "memory", "agent_memory.db")
-            conn = sqlite3.connect(db)
-            row = conn.execute("SELECT COUNT(*) FROM github_state").fetchone()
-            stats["GitHub Activity"] = row[0] if row else 0
+            github, pending = conn.execute(OVERVIEW_COUNTS_SQL).fetchone()
+            if last_action_id is None:
+                actions = conn.execute(
+                    "SELECT id, action_type, details, created_at FROM action_log "
+                    "ORDER BY id DESC LIMIT 15"
+                ).fetchall()
+            else:
+                actions = conn.execute(
+                    "SELECT id, action_type, details, created_at FROM action_log "
+                    "WHERE id > ? ORDER BY id DESC LIMIT 15",
+                    (last_action_id,)
+                ).fetchall()
+        except sqlite3.Error:
+            # Drop the handle (DB replaced, locked out, ...) so the next refresh reopens it
+            self._conn = None
             conn.close()
-        except Exception:
-            pass
-        return stats
+            raise
+        return {"github": github, "pending": pending, "actions": actions}
 
     def _refresh_overview(self):
-        # Update stats
+        """Run the overview reads on the worker pool; widgets update in _apply_overview."""
+        if not self._window_visible():
+            return  # Runs again on the first scheduler tick after the window is restored
+        if self._overview_future and not self._overview_future.done():
+            return  # Previous refresh still reading
+        self._overview_future = self._submit(self._refresh_overview_worker,
+                                             self._last_action_id,
+                                             on_done=self._apply_overview)
+
+    def _refresh_overview_worker(self, last_action_id) -> dict:
+        """Excel + SQLite reads for the overview. Runs off the Tk thread; touches no widgets."""
         stats = self._get_stats()
-        for name, lbl in self.stat_labels.items():
-            lbl.config(text=str(stats.get(name, 0)))
-
-        # Update pending approvals
         try:
-            import sqlite3
-            db = os.path.join(PROJECT_ROOT, "memory", "agent_memory.db")
-            conn = sqlite3.connect(db)
-            row = conn.execute(
-                "SELECT COUNT(*) FROM pending_tasks WHERE status = 'pending'"
-            ).fetchone()
-            self.pending_label.config(text=str(row[0] if row else 0))
-            conn.close()
+            db = self._refresh_overview_db(last_action_id)
         except Exception:
-            pass
+            db = {}
+        if "github" in db:
+            stats["GitHub Activity"] = db["github"]
+        return {"stats": stats, "pending": db.get("pending"), "actions": db.get("actions")}
 
-        # Update recent actions
-        try:
-            import sqlite3
-            db = os.path.join(PROJECT_ROOT, "memory", "agent_memory.db")
-            conn = sqlite3.connect(db)
-            rows = conn.execute(
-                "SELECT action_type, details, created_at FROM action_log ORDER BY id DESC LIMIT 15"
-            ).fetchall()
-            conn.close()
+    def _apply_overview(self, data):
+        stats = data["stats"]
+        pending = data["pending"]
+        rows = data["actions"]
 
-            self.log_text.config(state=tk.NORMAL)
-            self.log_text.delete("1.0", tk.END)
-            for r in rows:
-                ts = r[2][:16] if r[2] else ""
-                detail = (r[1] or "")[:80]
-                self.log_text.insert(tk.END, f"  {ts}  [{r[0]}]  {detail}\n")
-            self.log_text.config(state=tk.DISABLED)
-        except Exception:
-            pass
+        # Update stats — labels are only reconfigured when their number changed
+        for name, lbl in self.stat_labels.items():
+            new = str(stats.get(name, 0))
+            if new != self._stat_last_text[name]:
+                lbl.config(text=new)
+                self._stat_last_text[name] = new
 
-        # Schedule next refresh (30s)
-        self.root.after(30000, self._refresh_overview)
+        # Update pending approvals
+        if pending is not None and str(pending) != self._pending_last_text:
+            self._pending_last_text = str(pending)
+            self.pending_label.config(text=self._pending_last_text)
+
+        # Update recent actions
+        if rows:
+            self._last_action_id = rows[0][0]
+            self._recent_actions.extendleft(reversed(rows))
+
+            lines = "".join(f"  {(r[3] or '')[:16]}  [{r[1]}]  {(r[2] or '')[:80]}\n"
+                            for r in self._recent_actions)
+            if lines != self._last_log_text:
+                self.log_text.config(state=tk.NORMAL)
+                self.log_text.delete("1.0", tk.END)
+                self.log_text.insert("1.0", lines)
+                self.log_text.config(state=tk.DISABLED)
+                self._last_log_text = lines
 
     def _uitars_action(self, action, model=None):
         """Start/stop UI-TARS server from dashboard."""
@@ -384,15 +835,14 @@ class DashboardApp:
         """Set/revoke Allow All mode via bridge endpoint."""
         def run():
             try:
-                import requests as _req
                 if minutes > 0:
-                    _req.post(f"http://localhost:8000/permission/set_allow_all",
-                              json={"duration_minutes": minutes}, timeout=3)
+                    _HTTP.post("http://localhost:8000/permission/set_allow_all",
+                               json={"duration_minutes": minutes}, timeout=_HTTP_TIMEOUT)
                     self.root.after(0, lambda: self.perm_status.config(
                         text=f"AUTO MODE — {minutes}min remaining", fg=RED))
                 else:
-                    _req.post(f"http://localhost:8000/permission/set_allow_all",
-                              json={"duration_minutes": 0}, timeout=3)
+                    _HTTP.post("http://localhost:8000/permission/set_allow_all",
+                               json={"duration_minutes": 0}, timeout=_HTTP_TIMEOUT)
                     self.root.after(0, lambda: self.perm_status.config(
                         text="Manual — asking each action", fg=GREEN))
             except Exception:
@@ -403,67 +853,89 @@ class DashboardApp:
     def _review_pending(self):
         messagebox.showinfo("Pending Approvals",
                             "Open the Chrome Extension to review pending approvals.\n"
-                            "Or use CLI: python agent.py \"show approvals\"")
+                            "Or use CLI: python agent.py \"show approvals\"",
+                            parent=self.root)
 
     # ─── RAM Monitor ─────────────────────────────
 
+    # Minimum spacing between psutil samples, however often _update_ram is called
+    _VM_MIN_INTERVAL = 1.0
+    _last_vm_sample = (0.0, None)
+
+    def _probe_ollama(self):
+        """Refresh the cached Ollama model name on the worker pool, off the Tk thread.
+
+        Skipped while the Overview tab is hidden; the last-known name is kept.
+        """
+        if self._overview_active:
+            self._pool.submit(self._fetch_ollama_model)
+
+    def _fetch_ollama_model(self):
+        model_name = "none"
+        try:
+            r = _HTTP.get("http://localhost:11434/api/ps", timeout=_HTTP_TIMEOUT)
+            if r.status_code == 200:
+                models = r.json().get("models", [])
+                if models:
+                    model_name = models[0].get("name", "unknown")
+        except Exception:
+            pass
+        self._ollama_model_name = model_name
+
     def _update_ram(self):
+        if not self._window_visible():
+            return
         try:
-            mem = psutil.virtual_memory()
-            used_gb = mem.used / (1024 ** 3)
-            free_gb = mem.available / (1024 ** 3)
-            total_gb = mem.total / (1024 ** 3)
+            now = time.monotonic()
+            sampled_at, mem = self._last_vm_sample
+            if mem is None or now - sampled_at >= self._VM_MIN_INTERVAL:
+                mem = psutil.virtual_memory()
+                self._last_vm_sample = (now, mem)
+            used_gb = mem.used / _GIB
+            free_gb = mem.available / _GIB
+            total_gb = mem.total / _GIB
             pct = mem.percent
 
-            self.ram_bar["value"] = pct
-
-            # Check active Ollama model
-            model_name = "none"
-            try:
-                import requests
-                r = requests.get("http://localhost:11434/api/ps", timeout=2)
-                if r.status_code == 200:
-                    models = r.json().get("models", [])
-                    if models:
-                        model_name = models[0].get("name", "unknown")
-            except Exception:
-                pass
+            text = (f"  {used_gb:.1f}GB used  |  {free_gb:.1f}GB free  |  "
+                    f"{total_gb:.1f}GB total  |  Model: {self._ollama_model_name}")
 
-            color = GREEN if pct < 70 else YELLOW if pct < 85 else RED
-            self.ram_label.config(
-                text=f"  {used_gb:.1f}GB used  |  {free_gb:.1f}GB free  |  "
-                     f"{total_gb:.1f}GB total  |  Model: {model_name}",
-                fg=color
-            )
+            # Skip the widget updates when nothing visible changed
+            if text != self._last_ram_text:
+                bucket = "Green" if pct < 70 else "Yellow" if pct < 85 else "Red"
+                self.ram_label.config(text=text, fg=RAM_COLORS[bucket])
+                self.ram_bar["value"] = pct
+                self._last_ram_text = text
 
-            # Update progressbar color
-            self.style.configure("Dark.Horizontal.TProgressbar", background=color)
+                # Update progressbar color only when the bucket changes
+                if bucket != self._ram_style:
+                    self.ram_bar.configure(style=f"{bucket}.Horizontal.TProgressbar")
+                    self._ram_style = bucket
 
         except Exception:
             self.ram_label.config(text="  RAM: unavailable", fg=RED)
-
-        self.root.after(3000, self._update_ram)
+            self._last_ram_text = None
 
     # ─── Tab 2: Jobs ─────────────────────────────
 
-    def _build_jobs_tab(self):
-        tab = tk.Frame(self.notebook, bg=BG)
-        self.notebook.add(tab, text="  Jobs  ")
-
+    def _build_jobs_tab(self, tab):
         # Toolbar
         toolbar = tk.Frame(tab, bg=BG_CARD)
         toolbar.pack(fill=tk.X, padx=12, pady=(12, 6))
 
         tk.Button(toolbar, text="🔍 Search Jobs", bg=ACCENT, fg="white",
-                  font=("Segoe UI", 10, "bold"), bd=0, padx=14, pady=6,
+                  font=self._font_bold, bd=0, padx=14, pady=6,
                   command=self._search_jobs).pack(side=tk.LEFT, padx=4)
 
-        self.job_filter_var = tk.StringVar(value="all")
+        self.job_filter_var = tk.StringVar(master=self.root, value="all")
         for text, val in [("All", "all"), ("Applied", "applied"), ("Saved", "saved"),
                           ("Interview", "interview")]:
             tk.Radiobutton(toolbar, text=text, variable=self.job_filter_var, value=val,
                            bg=BG_CARD, fg=FG, selectcolor=BG_INPUT,
-                           font=("Segoe UI", 9), command=self._refresh_jobs).pack(side=tk.LEFT, padx=4)
+                           font=self._font_small, command=self._filter_jobs).pack(side=tk.LEFT, padx=4)
+
+        # Applications indexed by status; filter clicks only read this index
+        self._apps = None
+        self._apps_by_status = {}
 
         # Table
         cols = ("Date", "Title", "Company", "Score", "Status")
@@ -483,52 +955,84 @@ class DashboardApp:
         query = simpledialog.askstring("Search Jobs", "Enter job search query:",
                                         parent=self.root)
         if query:
-            threading.Thread(target=self._run_job_search, args=(query,), daemon=True).start()
+            self._spawn(self._run_job_search, query, on_done=self._on_job_search_done)
 
     def _run_job_search(self, query):
+        from tools.apply_workflow import run_job_search
+        return run_job_search(query)
+
+    def _on_job_search_done(self, _result):
+        self._stats_cache = (0.0, {})
+        self._excel_cache.clear()
+        self._refresh_when_visible(self._jobs_tab, self._refresh_jobs)
+
+    def _read_applications(self):
+        """Read applications from Excel and index them by lowercased status. Worker-safe.
+
+        The index is rebuilt only when _excel_cache returns a different list,
+        i.e. the workbook changed on disk or the cache entry expired.
+        """
         try:
-            from tools.apply_workflow import run_job_search
-            run_job_search(query)
-            self.root.after(0, self._refresh_jobs)
-        except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
+            apps = self._excel_cache.get(_excel.get_applications)
+        except Exception:
+            apps = []
+        if apps is self._apps:
+            return apps, self._apps_by_status
+        by_status = {}
+        for app in apps:
+            status = (app.get("Status") or "").lower()
+            by_status.setdefault(status, []).append(app)
+        return apps, by_status
+
+    @staticmethod
+    def _fill_tree(tree, rows):
+        """Replace every row of a Treeview: one delete call, then the prebuilt inserts."""
+        tree.delete(*tree.get_children())
+        for values in rows:
+            tree.insert("", "end", values=values)
 
     def _refresh_jobs(self):
-        for item in self.job_tree.get_children():
-            self.job_tree.delete(item)
+        # Reload on tab build, stale-tab selection and after a search; runs on the pool
+        self._submit(self._read_applications, on_done=self._on_applications_loaded)
+
+    def _filter_jobs(self):
+        # Filter clicks re-render from the prebuilt status index, no Excel access
+        self._fill_tree(self.job_tree, self._job_rows())
+
+    def _on_applications_loaded(self, result):
+        self._apps, self._apps_by_status = result
+        self._fill_tree(self.job_tree, self._job_rows())
+
+    def _job_rows(self):
+        status_filter = self.job_filter_var.get()
+        if status_filter == "all":
+            apps = self._apps or []
+        else:
+            apps = self._apps_by_status.get(status_filter, [])
         try:
-            from memory.excel_logger import get_applications
-            apps = get_applications()
-            status_filter = self.job_filter_var.get()
-            for app in apps:
-                if status_filter != "all" and app.get("Status", "").lower() != status_filter:
-                    continue
-                self.job_tree.insert("", "end", values=(
-                    app.get("Date", ""),
-                    app.get("Title", "")[:40],
-                    app.get("Company", "")[:25],
-                    app.get("Score", ""),
-                    app.get("Status", ""),
-                ))
+            return [(
+                app.get("Date", ""),
+                _trunc(app.get("Title"), 40),
+                _trunc(app.get("Company"), 25),
+                app.get("Score", ""),
+                app.get("Status", ""),
+            ) for app in apps]
         except Exception:
-            pass
+            return []
 
     # ─── Tab 3: Posts ────────────────────────────
 
-    def _build_posts_tab(self):
-        tab = tk.Frame(self.notebook, bg=BG)
-        self.notebook.add(tab, text="  Posts  ")
-
+    def _build_posts_tab(self, tab):
         toolbar = tk.Frame(tab, bg=BG_CARD)
         toolbar.pack(fill=tk.X, padx=12, pady=(12, 6))
 
         tk.Button(toolbar, text="📝 Generate Weekly Posts", bg=GREEN, fg="white",
-                  font=("Segoe UI", 10, "bold"), bd=0, padx=14, pady=6,
+                  font=self._font_bold, bd=0, padx=14, pady=6,
                   command=self._generate_posts).pack(side=tk.LEFT, padx=4)
 
         tk.Button(toolbar, text="📂 Open Drafts", bg=BG_INPUT, fg=FG,
-                  font=("Segoe UI", 10), bd=0, padx=14, pady=6,
-                  command=lambda: os.startfile(os.path.join(PROJECT_ROOT, "memory", "post_drafts"))
+                  font=self._font_body, bd=0, padx=14, pady=6,
+                  command=lambda: os.startfile(POST_DRAFTS_DIR)
                   ).pack(side=tk.LEFT, padx=4)
 
         cols = ("Date", "Type", "Preview", "Status", "Mode")
@@ -546,52 +1050,49 @@ class DashboardApp:
 
     def _generate_posts(self):
         mode = self.mode_var.get()
-        threading.Thread(target=self._run_generate_posts, args=(mode,), daemon=True).start()
+        self._spawn(self._run_generate_posts, mode,
+                    on_done=lambda posts: self._on_posts_generated(posts, mode))
 
     def _run_generate_posts(self, mode):
-        try:
-            from tools.post_scheduler import generate_weekly_posts
-            posts = generate_weekly_posts(mode=mode)
-            self.root.after(0, self._refresh_posts)
-            self.root.after(0, lambda: messagebox.showinfo(
-                "Posts Generated", f"Generated {len(posts)} posts (mode: {mode})"))
-        except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
+        from tools.post_scheduler import generate_weekly_posts
+        return generate_weekly_posts(mode=mode)
+
+    def _on_posts_generated(self, posts, mode):
+        self._stats_cache = (0.0, {})
+        self._excel_cache.clear()
+        self._refresh_when_visible(self._posts_tab, self._refresh_posts)
+        messagebox.showinfo("Posts Generated", f"Generated {len(posts)} posts (mode: {mode})",
+                            parent=self.root)
 
     def _refresh_posts(self):
-        for item in self.post_tree.get_children():
-            self.post_tree.delete(item)
+        self._submit(self._post_rows, on_done=lambda rows: self._fill_tree(self.post_tree, rows))
+
+    def _post_rows(self):
+        """Read posts from Excel into Treeview value tuples. Worker-safe."""
         try:
-            from memory.excel_logger import get_posts
-            posts = get_posts()
-            for p in posts:
-                self.post_tree.insert("", "end", values=(
-                    p.get("Date", ""),
-                    p.get("Type", ""),
-                    (p.get("Preview", "") or "")[:60],
-                    p.get("Status", ""),
-                    p.get("Mode", ""),
-                ))
+            return [(
+                p.get("Date", ""),
+                p.get("Type", ""),
+                _trunc(p.get("Preview"), 60),
+                p.get("Status", ""),
+                p.get("Mode", ""),
+            ) for p in self._excel_cache.get(_excel.get_posts)]
         except Exception:
-            pass
+            return []
 
     # ─── Tab 4: Gigs ─────────────────────────────
 
-    def _build_gigs_tab(self):
-        tab = tk.Frame(self.notebook, bg=BG)
-        self.notebook.add(tab, text="  Gigs  ")
-
+    def _build_gigs_tab(self, tab):
         toolbar = tk.Frame(tab, bg=BG_CARD)
         toolbar.pack(fill=tk.X, padx=12, pady=(12, 6))
 
         tk.Button(toolbar, text="🛠️ Create Gig", bg=PURPLE, fg="white",
-                  font=("Segoe UI", 10, "bold"), bd=0, padx=14, pady=6,
+                  font=self._font_bold, bd=0, padx=14, pady=6,
                   command=self._create_gig).pack(side=tk.LEFT, padx=4)
 
         tk.Button(toolbar, text="📊 Open Excel", bg=BG_INPUT, fg=FG,
-                  font=("Segoe UI", 10), bd=0, padx=14, pady=6,
-                  command=lambda: os.startfile(
-                      os.path.join(PROJECT_ROOT, "memory", "gigs_created.xlsx"))
+                  font=self._font_body, bd=0, padx=14, pady=6,
+                  command=lambda: os.startfile(GIGS_XLSX)
                   ).pack(side=tk.LEFT, padx=4)
 
         cols = ("Date", "Platform", "Service", "Title", "Status")
@@ -612,54 +1113,53 @@ class DashboardApp:
             "Service type (mlops / chatbot / blockchain / data_science / backend):",
             parent=self.root)
         if service:
-            threading.Thread(target=self._run_create_gig, args=(service,), daemon=True).start()
+            self._spawn(self._run_create_gig, service,
+                        on_done=lambda result: self._on_gig_created(result, service))
 
     def _run_create_gig(self, service):
-        try:
-            from tools.content_tools import generate_gig_description
-            result = generate_gig_description(service)
-            self.root.after(0, self._refresh_gigs)
-            self.root.after(0, lambda: messagebox.showinfo("Gig Created",
-                f"Gig for '{service}' created:\n{json.dumps(result, indent=2)[:500]}"))
-        except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", str(e)))
+        from tools.content_tools import generate_gig_description
+        return generate_gig_description(service)
+
+    def _on_gig_created(self, result, service):
+        self._stats_cache = (0.0, {})
+        self._excel_cache.clear()
+        self._refresh_when_visible(self._gigs_tab, self._refresh_gigs)
+        messagebox.showinfo("Gig Created",
+            f"Gig for '{service}' created:\n{_json_dumps(result)[:500]}",
+            parent=self.root)
 
     def _refresh_gigs(self):
-        for item in self.gig_tree.get_children():
-            self.gig_tree.delete(item)
+        self._submit(self._gig_rows, on_done=lambda rows: self._fill_tree(self.gig_tree, rows))
+
+    def _gig_rows(self):
+        """Read gigs from Excel into Treeview value tuples. Worker-safe."""
         try:
-            from memory.excel_logger import get_gigs
-            gigs = get_gigs()
-            for g in gigs:
-                self.gig_tree.insert("", "end", values=(
-                    g.get("Date", ""),
-                    g.get("Platform", ""),
-                    g.get("Service Type", ""),
-                    (g.get("Title", "") or "")[:50],
-                    g.get("Status", ""),
-                ))
+            return [(
+                g.get("Date", ""),
+                g.get("Platform", ""),
+                g.get("Service Type", ""),
+                _trunc(g.get("Title"), 50),
+                g.get("Status", ""),
+            ) for g in self._excel_cache.get(_excel.get_gigs)]
         except Exception:
-            pass
+            return []
 
     # ─── Tab 5: Settings ─────────────────────────
 
-    def _build_settings_tab(self):
-        tab = tk.Frame(self.notebook, bg=BG)
-        self.notebook.add(tab, text="  Settings  ")
-
+    def _build_settings_tab(self, tab):
         toolbar = tk.Frame(tab, bg=BG_CARD)
         toolbar.pack(fill=tk.X, padx=12, pady=(12, 6))
 
         tk.Button(toolbar, text="💾 Save Settings", bg=GREEN, fg="white",
-                  font=("Segoe UI", 10, "bold"), bd=0, padx=14, pady=6,
+                  font=self._font_bold, bd=0, padx=14, pady=6,
                   command=self._save_settings_text).pack(side=tk.LEFT, padx=4)
 
         tk.Button(toolbar, text="🔄 Reload", bg=BG_INPUT, fg=FG,
-                  font=("Segoe UI", 10), bd=0, padx=14, pady=6,
+                  font=self._font_body, bd=0, padx=14, pady=6,
                   command=self._load_settings_text).pack(side=tk.LEFT, padx=4)
 
         self.settings_text = scrolledtext.ScrolledText(tab, bg=BG_INPUT, fg=FG,
-                                                        font=("Consolas", 11),
+                                                        font=self._font_editor,
                                                         insertbackground=FG,
                                                         bd=0, wrap=tk.WORD)
         self.settings_text.pack(fill=tk.BOTH, expand=True, padx=12, pady=(0, 12))
@@ -675,14 +1175,15 @@ class DashboardApp:
             self.settings_text.insert("1.0", "# Settings file not found")
 
     def _save_settings_text(self):
-        text = self.settings_text.get("1.0", tk.END)
+        text = self.settings_text.get("1.0", "end-1c")  # Drop Tk's trailing newline
         try:
-            yaml.safe_load(text)  # Validate YAML
-            with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-                f.write(text)
-            messagebox.showinfo("Saved", "Settings saved successfully!")
+            yaml.load(text, Loader=_YamlLoader)  # Validate YAML
+            if write_settings_text(text):
+                messagebox.showinfo("Saved", "Settings saved successfully!", parent=self.root)
+            else:
+                messagebox.showinfo("Saved", "No changes to save.", parent=self.root)
         except yaml.YAMLError as e:
-            messagebox.showerror("YAML Error", f"Invalid YAML:\n{e}")
+            messagebox.showerror("YAML Error", f"Invalid YAML:\n{e}", parent=self.root)
 
 
     # ─── Command Tab ─────────────────────────────────────
@@ -695,20 +1196,22 @@ class DashboardApp:
         top_bar = tk.Frame(tab, bg=BG_CARD)
         top_bar.pack(fill=tk.X, padx=12, pady=(12, 4))
         tk.Label(top_bar, text="Agent Command Prompt",
-                 bg=BG_CARD, fg=FG, font=("Segoe UI", 13, "bold")).pack(side=tk.LEFT, padx=12, pady=8)
+                 bg=BG_CARD, fg=FG, font=self._font_heading).pack(side=tk.LEFT, padx=12, pady=8)
         self.cmd_status_label = tk.Label(top_bar, text="● Ready", bg=BG_CARD, fg=GREEN,
-                                          font=("Segoe UI", 10, "bold"))
+                                          font=self._font_bold)
         self.cmd_status_label.pack(side=tk.RIGHT, padx=12)
+        self._cmd_status = ("● Ready", GREEN)
 
         # Output area
         self.cmd_output = scrolledtext.ScrolledText(tab, bg="#0c1222", fg="#a5f3fc",
-                                                     font=("Consolas", 10),
+                                                     font=self._font_mono,
                                                      insertbackground=FG, bd=0,
-                                                     wrap=tk.WORD, state=tk.DISABLED)
+                                                     wrap=tk.WORD, state=tk.DISABLED,
+                                                     undo=False)
         self.cmd_output.pack(fill=tk.BOTH, expand=True, padx=12, pady=4)
 
         # Tag configs for colored output
-        self.cmd_output.tag_configure("header", foreground="#60a5fa", font=("Consolas", 10, "bold"))
+        self.cmd_output.tag_configure("header", foreground="#60a5fa", font=self._font_mono_bold)
         self.cmd_output.tag_configure("result", foreground="#34d399")
         self.cmd_output.tag_configure("error", foreground="#f87171")
         self.cmd_output.tag_configure("info", foreground="#94a3b8")
@@ -719,11 +1222,13 @@ class DashboardApp:
 
         # Prompt indicator
         tk.Label(input_frame, text="❯", bg=BG_CARD, fg=ACCENT,
-                 font=("Consolas", 16, "bold")).pack(side=tk.LEFT, padx=(12, 4))
+                 font=self._font_prompt).pack(side=tk.LEFT, padx=(12, 4))
 
         # Input field
-        self.cmd_entry = tk.Entry(input_frame, bg=BG_INPUT, fg=FG,
-                                  font=("Consolas", 12), bd=0,
+        self._cmd_var = tk.StringVar(master=self.root)
+        self.cmd_entry = tk.Entry(input_frame, textvariable=self._cmd_var,
+                                  bg=BG_INPUT, fg=FG,
+                                  font=self._font_input, bd=0,
                                   insertbackground=FG, relief=tk.FLAT)
         self.cmd_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=4, ipady=8)
         self.cmd_entry.bind("<Return>", lambda e: self._run_agent_command())
@@ -733,37 +1238,70 @@ class DashboardApp:
 
         # Send button
         self.cmd_send_btn = tk.Button(input_frame, text="Send ▶", bg=ACCENT, fg="white",
-                  font=("Segoe UI", 10, "bold"), bd=0, padx=16, pady=6,
+                  font=self._font_bold, bd=0, padx=16, pady=6,
                   command=self._run_agent_command, cursor="hand2")
         self.cmd_send_btn.pack(side=tk.LEFT, padx=(4, 4))
 
         # Clear button
         tk.Button(input_frame, text="Clear", bg=BG_INPUT, fg=FG_DIM,
-                  font=("Segoe UI", 9), bd=0, padx=10, pady=6,
+                  font=self._font_small, bd=0, padx=10, pady=6,
                   command=self._clear_output).pack(side=tk.LEFT, padx=(0, 12))
 
-        # Welcome message
-        self._append_output("BilalAgent v3.0 — Ready\n", "header")
-        self._append_output("Type any command and press Enter or click Send.\n", "info")
-        self._append_output("Examples:\n", "info")
-        self._append_output('  "brand check"                — GitHub activity report\n', "info")
-        self._append_output('  "write linkedin post about basepy"  — Generate post\n', "info")
-        self._append_output('  "search python developer jobs"      — Multi-site search\n', "info")
-        self._append_output('  "generate all gigs"           — Create 5 Fiverr gigs\n', "info")
-        self._append_output('  "what are my strongest skills" — NLP analysis\n', "info")
-        self._append_output("─" * 60 + "\n", "info")
+        # Welcome message: one tagged chunk per style, inserted in the first flush
+        self._insert_batch([
+            ("BilalAgent v3.0 — Ready\n", "header"),
+            ("Type any command and press Enter or click Send.\n"
+             "Examples:\n"
+             '  "brand check"                — GitHub activity report\n'
+             '  "write linkedin post about basepy"  — Generate post\n'
+             '  "search python developer jobs"      — Multi-site search\n'
+             '  "generate all gigs"           — Create 5 Fiverr gigs\n'
+             '  "what are my strongest skills" — NLP analysis\n'
+             + _SEPARATOR, "info"),
+        ])
 
     def _append_output(self, text, tag=None):
-        """Thread-safe append to output panel."""
-        def _do():
-            self.cmd_output.config(state=tk.NORMAL)
-            if tag:
-                self.cmd_output.insert(tk.END, text, tag)
+        """Thread-safe append to output panel; writes are coalesced every 50 ms."""
+        self._insert_batch(((text, tag),))
+
+    def _insert_batch(self, chunks):
+        """Thread-safe append of several (text, tag) chunks for the next flush."""
+        self._pending_output.extend(chunks)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.root.after(50, self._flush_output)
+
+    def _flush_output(self):
+        """Insert everything queued since the last flush in one Text update."""
+        # Clear the flag before draining so appends racing with us re-arm a flush
+        self._flush_scheduled = False
+        runs = []  # [text, tag] with consecutive same-tag chunks joined
+        while self._pending_output:
+            text, tag = self._pending_output.popleft()
+            if runs and runs[-1][1] == tag:
+                runs[-1][0] += text
             else:
-                self.cmd_output.insert(tk.END, text)
+                runs.append([text, tag])
+        if not runs:
+            return
+        args = []
+        for text, tag in runs:
+            args += (text, tag or ())
+        # Follow the tail only if the view was already at the bottom
+        follow = self.cmd_output.yview()[1] >= 0.999
+        # One state toggle per flush. DISABLED (not a <Key> "break" binding) is what
+        # keeps the panel read-only: it also blocks paste/cut but leaves copy working.
+        self.cmd_output.config(state=tk.NORMAL)
+        self.cmd_output.insert(tk.END, *args)
+        # Ring buffer: Text inserts slow down as the line count grows
+        lines = int(self.cmd_output.index("end-1c").split(".")[0])
+        if lines > OUTPUT_MAX_LINES:
+            # Enough to get back under the cap even after one very large flush
+            excess = lines - OUTPUT_MAX_LINES + OUTPUT_TRIM_LINES
+            self.cmd_output.delete("1.0", f"{excess + 1}.0")
+        if follow:
             self.cmd_output.see(tk.END)
-            self.cmd_output.config(state=tk.DISABLED)
-        self.root.after(0, _do)
+        self.cmd_output.config(state=tk.DISABLED)
 
     def _clear_output(self):
         self.cmd_output.config(state=tk.NORMAL)
@@ -778,12 +1316,54 @@ class DashboardApp:
             len(self._cmd_history) - 1,
             self._cmd_history_idx + direction
         ))
-        self.cmd_entry.delete(0, tk.END)
-        self.cmd_entry.insert(0, self._cmd_history[self._cmd_history_idx])
+        self._cmd_var.set(self._cmd_history[self._cmd_history_idx])
+        self.cmd_entry.icursor(tk.END)
+
+    def _set_status(self, text, fg):
+        """Thread-safe status label update; also syncs the Send button with _agent_running."""
+        def _do():
+            if (text, fg) == self._cmd_status:
+                return
+            self._cmd_status = (text, fg)
+            self.cmd_status_label.configure(text=text, fg=fg)
+            ready = not self._agent_running
+            self.cmd_send_btn.configure(state=tk.NORMAL if ready else tk.DISABLED,
+                                        bg=ACCENT if ready else BG_INPUT)
+        self.root.after(0, _do)
+
+    def _load_agent(self):
+        """Prepare the agent DB and import handle_command; runs on a daemon thread."""
+        from memory.db import init_db
+        init_db()
+        self._load_profile()
+        from agent import handle_command
+        return handle_command
+
+    def _agent_handle_command(self):
+        """agent.handle_command, waiting for the startup import if it is still running."""
+        try:
+            return self._agent_future.result()
+        except Exception:
+            # Retry the import on the next command rather than failing forever
+            self._agent_future = self._start_daemon(self._load_agent)
+            raise
+
+    def _load_profile(self) -> dict:
+        """Parsed profile.yaml; re-parsed only when its mtime/size change. Returns a copy."""
+        try:
+            st = os.stat(PROFILE_PATH)
+            if not (self._profile_cache
+                    and self._profile_cache[:2] == (st.st_mtime_ns, st.st_size)):
+                with open(PROFILE_PATH, "r", encoding="utf-8") as f:
+                    profile = yaml.load(f, Loader=_YamlLoader) or {}
+                self._profile_cache = (st.st_mtime_ns, st.st_size, profile)
+            return copy.deepcopy(self._profile_cache[2])
+        except Exception:
+            return {}
 
     def _run_agent_command(self):
         """Run user command through agent.handle_command() in a background thread."""
-        command = self.cmd_entry.get().strip()
+        command = self._cmd_var.get().strip()
         if not command or self._agent_running:
             return
 
@@ -792,58 +1372,44 @@ class DashboardApp:
         self._cmd_history_idx = len(self._cmd_history)
 
         # Clear input
-        self.cmd_entry.delete(0, tk.END)
+        self._cmd_var.set("")
 
         # Update UI
         self._agent_running = True
-        self.root.after(0, lambda: self.cmd_status_label.config(text="● Running...", fg=YELLOW))
-        self.root.after(0, lambda: self.cmd_send_btn.config(state=tk.DISABLED, bg=BG_INPUT))
+        self._set_status("● Running...", YELLOW)
         self._append_output(f"\n❯ {command}\n", "header")
 
         def worker():
-            import io
             import contextlib
 
-            # Capture stdout
-            capture = io.StringIO()
+            # Stream stdout into the output panel as the agent prints
+            sink = _LineSink(lambda text: self._append_output(text, "result"))
             try:
-                # Import agent components
-                from memory.db import init_db
-                init_db()
+                handle_command = self._agent_handle_command()
+                profile = self._load_profile()
 
-                # Load profile
-                profile = {}
+                # Redirect stdout to the sink
                 try:
-                    profile_path = os.path.join(PROJECT_ROOT, "config", "profile.yaml")
-                    with open(profile_path, "r", encoding="utf-8") as f:
-                        profile = yaml.safe_load(f) or {}
-                except Exception:
-                    pass
-
-                # Redirect stdout to capture
-                with contextlib.redirect_stdout(capture):
-                    from agent import handle_command
-                    result = handle_command(command, profile)
-
-                # Get captured output
-                output = capture.getvalue()
-                if output:
-                    self._append_output(output, "result")
+                    with contextlib.redirect_stdout(sink):
+                        result = handle_command(command, profile)
+                finally:
+                    sink.flush()  # Trailing text without a newline
 
                 # If result is a dict, show it too
                 if result and isinstance(result, dict):
-                    self._append_output(f"\n{json.dumps(result, indent=2)}\n", "result")
+                    self._append_output(f"\n{_json_dumps(result)}\n", "result")
 
             except Exception as e:
                 self._append_output(f"\n✗ Error: {e}\n", "error")
-                import traceback
-                self._append_output(traceback.format_exc(), "error")
+                # Full tracebacks only with `debug: true` in settings.yaml
+                if load_settings().get("debug"):
+                    import traceback
+                    self._append_output(traceback.format_exc(), "error")
 
             finally:
-                self._append_output("─" * 60 + "\n", "info")
+                self._append_output(_SEPARATOR, "info")
                 self._agent_running = False
-                self.root.after(0, lambda: self.cmd_status_label.config(text="● Ready", fg=GREEN))
-                self.root.after(0, lambda: self.cmd_send_btn.config(state=tk.NORMAL, bg=ACCENT))
+                self._set_status("● Ready", GREEN)
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -5,6 +5,7 @@ Status icon with right-click menu, toast notifications, mode switching.
 
 import os
 import sys
+import copy
 import threading
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -21,31 +22,51 @@ except ImportError:
 
 import yaml
 
+# libyaml C bindings when available, pure-Python fallback otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 
 # ─── Settings ────────────────────────────────────
 
 SETTINGS_PATH = os.path.join(PROJECT_ROOT, "config", "settings.yaml")
+ICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon.png")
+
+# (mtime_ns, size, parsed) of the last settings.yaml read
+_SETTINGS_CACHE = None
 
 
 def load_settings() -> dict:
+    """Parsed settings.yaml; re-parsed only when its mtime/size change. Returns a copy."""
+    global _SETTINGS_CACHE
     try:
+        st = os.stat(SETTINGS_PATH)
+        if _SETTINGS_CACHE and _SETTINGS_CACHE[:2] == (st.st_mtime_ns, st.st_size):
+            return copy.deepcopy(_SETTINGS_CACHE[2])
         with open(SETTINGS_PATH, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YamlLoader) or {}
+        _SETTINGS_CACHE = (st.st_mtime_ns, st.st_size, data)
+        return copy.deepcopy(data)
     except Exception:
         return {"intelligence_mode": "local"}
 
 
 def save_setting(key: str, value):
+    global _SETTINGS_CACHE
     settings = load_settings()
     settings[key] = value
     with open(SETTINGS_PATH, "w", encoding="utf-8") as f:
-        yaml.dump(settings, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(settings, f, Dumper=_YamlDumper,
+                  default_flow_style=False, sort_keys=False)
+    _SETTINGS_CACHE = None  # Coarse mtimes may not tick on a quick rewrite
 
 
 # ─── Icon Generation ─────────────────────────────
 
 def create_icon_image() -> Image.Image:
-    """Create a 64x64 blue icon with 'BA' text."""
+    """Create a 64x64 blue icon with 'BA' text. Only runs when icon.png must be (re)built."""
     img = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
@@ -72,6 +93,20 @@ def create_icon_image() -> Image.Image:
     return img
 
 
+def load_icon_image() -> Image.Image:
+    """Pre-rendered tray icon; drawn (and saved for next time) only if icon.png is missing."""
+    try:
+        with Image.open(ICON_PATH) as img:
+            return img.copy()
+    except OSError:  # Missing or unreadable
+        img = create_icon_image()
+        try:
+            img.save(ICON_PATH)
+        except OSError:
+            pass
+        return img
+
+
 # ─── Toast Notifications ─────────────────────────
 
 def show_toast(title: str, message: str):
@@ -93,6 +128,25 @@ def show_toast(title: str, message: str):
             print(f"[TOAST] {title}: {message}")
 
 
+# ─── Dialogs ─────────────────────────────────────
+
+def _ask_string(title: str, prompt: str):
+    """simpledialog.askstring on a hidden root owned by the calling action thread.
+
+    The root is created and destroyed on that (daemon) thread for each dialog:
+    a Tk interpreter must be freed by the thread that created it, and a
+    daemon thread never holds up tray exit while a prompt is still open.
+    """
+    import tkinter as tk
+    from tkinter import simpledialog
+    root = tk.Tk()
+    root.withdraw()
+    try:
+        return simpledialog.askstring(title, prompt, parent=root)
+    finally:
+        root.destroy()
+
+
 # ─── Menu Actions ────────────────────────────────
 
 def open_dashboard(icon=None, item=None):
@@ -106,12 +160,7 @@ def open_dashboard(icon=None, item=None):
 def find_jobs(icon=None, item=None):
     """Run job search with keyword input."""
     def _run():
-        import tkinter as tk
-        from tkinter import simpledialog
-        root = tk.Tk()
-        root.withdraw()
-        query = simpledialog.askstring("Find Jobs", "Enter search query:", parent=root)
-        root.destroy()
+        query = _ask_string("Find Jobs", "Enter search query:")
         if query:
             try:
                 from tools.apply_workflow import run_job_search
@@ -139,13 +188,8 @@ def write_post(icon=None, item=None):
 def create_gig(icon=None, item=None):
     """Create a Fiverr gig."""
     def _run():
-        import tkinter as tk
-        from tkinter import simpledialog
-        root = tk.Tk()
-        root.withdraw()
-        service = simpledialog.askstring("Create Gig",
-            "Service (mlops/chatbot/blockchain/data_science/backend):", parent=root)
-        root.destroy()
+        service = _ask_string("Create Gig",
+            "Service (mlops/chatbot/blockchain/data_science/backend):")
         if service:
             try:
                 from tools.content_tools import generate_gig_description
@@ -169,10 +213,15 @@ def check_projects(icon=None, item=None):
     threading.Thread(target=_run, daemon=True).start()
 
 
+def _open_file(path: str):
+    """os.startfile on a daemon thread; resolving the file association can block."""
+    threading.Thread(target=os.startfile, args=(path,), daemon=True).start()
+
+
 def view_job_log(icon=None, item=None):
     path = os.path.join(PROJECT_ROOT, "memory", "applied_jobs.xlsx")
     if os.path.exists(path):
-        os.startfile(path)
+        _open_file(path)
     else:
         show_toast("No Log", "No applied_jobs.xlsx found yet")
 
@@ -180,13 +229,13 @@ def view_job_log(icon=None, item=None):
 def view_post_log(icon=None, item=None):
     path = os.path.join(PROJECT_ROOT, "memory", "linkedin_posts.xlsx")
     if os.path.exists(path):
-        os.startfile(path)
+        _open_file(path)
     else:
         show_toast("No Log", "No linkedin_posts.xlsx found yet")
 
 
 def open_settings(icon=None, item=None):
-    os.startfile(SETTINGS_PATH)
+    _open_file(SETTINGS_PATH)
 
 
 def set_mode(mode_name: str):
@@ -208,6 +257,15 @@ def quit_app(icon, item):
 
 # ─── Build Menu ──────────────────────────────────
 
+def _mode_checked(mode_name: str):
+    """checked= callback for a mode item; re-evaluated by pystray on every menu render.
+
+    load_settings() is a cached stat until settings.yaml changes, so mode
+    changes made elsewhere (e.g. the dashboard's Overview tab) show up here.
+    """
+    return lambda item: load_settings().get("intelligence_mode") == mode_name
+
+
 def build_menu():
     settings = load_settings()
     current_mode = settings.get("intelligence_mode", "local")
@@ -229,11 +287,11 @@ def build_menu():
         pystray.Menu.SEPARATOR,
         pystray.MenuItem("Intelligence Mode", pystray.Menu(
             pystray.MenuItem("🔒 Pure Local", set_mode("local"),
-                             checked=lambda item: load_settings().get("intelligence_mode") == "local"),
+                             checked=_mode_checked("local")),
             pystray.MenuItem("🌐 Web Copilot", set_mode("web_copilot"),
-                             checked=lambda item: load_settings().get("intelligence_mode") == "web_copilot"),
+                             checked=_mode_checked("web_copilot")),
             pystray.MenuItem("✨ Hybrid Refiner", set_mode("hybrid"),
-                             checked=lambda item: load_settings().get("intelligence_mode") == "hybrid"),
+                             checked=_mode_checked("hybrid")),
         )),
         pystray.MenuItem("Settings", open_settings),
         pystray.MenuItem("Quit", quit_app),
@@ -244,7 +302,7 @@ def build_menu():
 
 def launch_tray():
     """Launch the system tray icon."""
-    icon_image = create_icon_image()
+    icon_image = load_icon_image()
     settings = load_settings()
     current_mode = settings.get("intelligence_mode", "local")
     labels = {"local": "Pure Local", "web_copilot": "Web Copilot", "hybrid": "Hybrid Refiner"}